@@ -9,9 +9,9 @@ Environment Variables:
     NOTION_API_KEY: Notion API key (required)
     BLOG_DATASOURCE_ID: Notion data source ID (required)
     OUTPUT_DIR: Directory to write MDX files (default: ./content)
+    NOTION_MAX_CONCURRENCY: Max concurrent Notion requests, a positive integer (default: 8)
 """
 
-import json
 import os
 import sys
 
@@ -21,7 +21,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from tasks import fetch_datasource_pages, convert_pages_to_mdx
-from utils.notion import set_github_output
+from utils.notion import dumps_json, get_max_concurrent_requests, set_github_outputs
 
 
 def main():
@@ -33,19 +33,28 @@ def main():
         print("Error: BLOG_DATASOURCE_ID environment variable is required")
         sys.exit(1)
     
-    print("Notion to MDX Scripts - Blog to MDX Converter")
-    print("====================================")
-    print(f"Data Source: {data_source_id}")
-    print(f"Output Dir:  {output_dir}")
-    print()
+    try:
+        get_max_concurrent_requests()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    sys.stdout.write("\n".join([
+        "Notion to MDX Scripts - Blog to MDX Converter",
+        "====================================",
+        f"Data Source: {data_source_id}",
+        f"Output Dir:  {output_dir}",
+    ]) + "\n\n")
     
     # Step 1: Fetch all pages from data source
     print("Fetching pages from data source...")
     try:
         all_pages = fetch_datasource_pages(data_source_id)
-        # Filter to only published pages
+        total_pages = len(all_pages)
+        # Filter to only published pages and release the unpublished ones
         pages = [p for p in all_pages if p.get_status() == "Publish"]
-        print(f"Found {len(all_pages)} pages, {len(pages)} published\n")
+        del all_pages
+        print(f"Found {total_pages} pages, {len(pages)} published\n")
     except Exception as e:
         print(f"Error fetching data source: {e}")
         sys.exit(1)
@@ -54,14 +63,19 @@ def main():
     generated_files = convert_pages_to_mdx(pages, output_dir)
     
     # Set GitHub Actions outputs
-    set_github_output("files", json.dumps(generated_files))
-    set_github_output("file_count", str(len(generated_files)))
+    set_github_outputs({
+        "files": dumps_json(generated_files),
+        "file_count": str(len(generated_files)),
+    })
     
-    # Summary
-    print("====================================")
-    print(f"Generated {len(generated_files)} MDX files")
-    for f in generated_files:
-        print(f"  ✓ {f}")
+    # Summary, written in one go rather than one print per file
+    summary = [
+        "====================================",
+        f"Generated {len(generated_files)} MDX files",
+        *(f"  ✓ {f}" for f in generated_files),
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
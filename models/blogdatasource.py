@@ -10,7 +10,20 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from .pageblocks import RichText, EmojiIcon, FileIcon
+from .pageblocks import RichText
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _plain_text(rich_text: list[RichText]) -> str:
+    """Join rich text runs into plain text."""
+    # Titles, slugs and descriptions are almost always a single run
+    if len(rich_text) == 1:
+        return rich_text[0].plain_text
+    # A list lets str.join size the result up front, unlike a generator
+    return "".join([rt.plain_text for rt in rich_text])
 
 
 # =============================================================================
@@ -77,41 +90,23 @@ class BlogProperties(BaseModel):
         populate_by_name = True
 
 
-# =============================================================================
-# Parent Types
-# =============================================================================
-
-class DataSourceParent(BaseModel):
-    """Parent reference for data source pages."""
-    type: Literal["data_source_id"] = "data_source_id"
-    data_source_id: str
-    database_id: str
-
-
 # =============================================================================
 # Blog Page
 # =============================================================================
 
-class PartialUser(BaseModel):
-    """Partial user reference."""
-    object: Literal["user"] = "user"
-    id: str
-
-
-Icon = EmojiIcon | FileIcon | None
-
-
 class BlogPage(BaseModel):
     """A blog page from the data source query."""
     object: Literal["page"] = "page"
     id: str
     created_time: datetime
     last_edited_time: datetime
-    created_by: PartialUser
-    last_edited_by: PartialUser
+    # Metadata the MDX pipeline never reads is kept as raw JSON so it
+    # skips nested model validation on every page
+    created_by: dict | None = None
+    last_edited_by: dict | None = None
     cover: dict | None = None
-    icon: Icon = None
-    parent: DataSourceParent
+    icon: dict | None = None
+    parent: dict | None = None
     archived: bool = False
     in_trash: bool = False
     is_locked: bool = False
@@ -125,19 +120,20 @@ class BlogPage(BaseModel):
 
     def get_title(self) -> str:
         """Get the blog title as plain text."""
-        return "".join(rt.plain_text for rt in self.properties.Name.title)
+        return _plain_text(self.properties.Name.title)
 
     def get_slug(self) -> str:
         """Get the blog slug as plain text."""
-        return "".join(rt.plain_text for rt in self.properties.Slug.rich_text)
+        return _plain_text(self.properties.Slug.rich_text)
 
     def get_description(self) -> str:
         """Get the blog description as plain text."""
-        return "".join(rt.plain_text for rt in self.properties.Description.rich_text)
+        return _plain_text(self.properties.Description.rich_text)
 
     def get_status(self) -> str | None:
         """Get the blog status name."""
-        return self.properties.Status.select.name if self.properties.Status.select else None
+        select = self.properties.Status.select
+        return select.name if select else None
 
     def get_tags(self) -> list[str]:
         """Get the blog tags as a list of strings."""
@@ -145,11 +141,12 @@ class BlogPage(BaseModel):
 
     def get_type(self) -> str | None:
         """Get the blog type name."""
-        return self.properties.Type.select.name if self.properties.Type.select else None
+        select = self.properties.Type.select
+        return select.name if select else None
 
     def get_notion_page_id(self) -> str | None:
         """Get the notion page id."""
-        return self.url.split("-")[-1]
+        return self.url.rpartition("-")[2]
 
 
 
@@ -8,9 +8,10 @@ Based on: https://developers.notion.com/reference/block
 from __future__ import annotations
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Literal, Union
+from operator import attrgetter
+from typing import Annotated, Any, Callable, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -45,7 +46,9 @@ class NotionColor(str, Enum):
 # =============================================================================
 
 class Annotations(BaseModel):
-    """Text annotations for rich text."""
+    """Text annotations for rich text (immutable, so defaults can be shared)."""
+    model_config = ConfigDict(frozen=True)
+
     bold: bool = False
     italic: bool = False
     strikethrough: bool = False
@@ -54,6 +57,10 @@ class Annotations(BaseModel):
     color: NotionColor = NotionColor.DEFAULT
 
 
+# Shared by every RichText without explicit annotations
+_DEFAULT_ANNOTATIONS = Annotations()
+
+
 class TextContent(BaseModel):
     """Text content with optional link."""
     content: str
@@ -86,26 +93,11 @@ class RichText(BaseModel):
     text: TextContent | None = None
     mention: Mention | None = None
     equation: Equation | None = None
-    annotations: Annotations = Field(default_factory=Annotations)
+    annotations: Annotations = Field(default_factory=lambda: _DEFAULT_ANNOTATIONS)
     plain_text: str
     href: str | None = None
 
 
-class PartialUser(BaseModel):
-    """Partial user object."""
-    object: Literal["user"] = "user"
-    id: str
-
-
-class Parent(BaseModel):
-    """Parent object for blocks."""
-    type: Literal["page_id", "block_id", "workspace", "database_id"]
-    page_id: str | None = None
-    block_id: str | None = None
-    database_id: str | None = None
-    workspace: bool | None = None
-
-
 # =============================================================================
 # File Objects
 # =============================================================================
@@ -280,11 +272,13 @@ class BlockBase(BaseModel):
     """Base class for all Notion blocks."""
     object: Literal["block"] = "block"
     id: str
-    parent: Parent
     created_time: datetime
     last_edited_time: datetime
-    created_by: PartialUser
-    last_edited_by: PartialUser
+    # Metadata the renderers never read is kept as raw JSON so it skips
+    # nested model validation on every block
+    parent: dict | None = None
+    created_by: dict | None = None
+    last_edited_by: dict | None = None
     has_children: bool = False
     archived: bool = False
     in_trash: bool = False
@@ -511,35 +505,12 @@ class PageBlocksResponse(BaseModel):
     @staticmethod
     def _extract_plain_text(rich_text_list: list[RichText]) -> str:
         """Extract plain text from a list of rich text objects."""
-        return "".join(rt.plain_text for rt in rich_text_list)
+        return "".join(map(_PLAIN_TEXT, rich_text_list))
 
     @staticmethod
     def _get_block_text(block: Block) -> str:
         """Extract the main text content from a block."""
-        block_type = block.type
-        
-        content_map = {
-            "paragraph": lambda b: PageBlocksResponse._extract_plain_text(b.paragraph.rich_text),
-            "heading_1": lambda b: PageBlocksResponse._extract_plain_text(b.heading_1.rich_text),
-            "heading_2": lambda b: PageBlocksResponse._extract_plain_text(b.heading_2.rich_text),
-            "heading_3": lambda b: PageBlocksResponse._extract_plain_text(b.heading_3.rich_text),
-            "heading_4": lambda b: PageBlocksResponse._extract_plain_text(b.heading_4.rich_text),
-            "bulleted_list_item": lambda b: PageBlocksResponse._extract_plain_text(b.bulleted_list_item.rich_text),
-            "numbered_list_item": lambda b: PageBlocksResponse._extract_plain_text(b.numbered_list_item.rich_text),
-            "to_do": lambda b: PageBlocksResponse._extract_plain_text(b.to_do.rich_text),
-            "toggle": lambda b: PageBlocksResponse._extract_plain_text(b.toggle.rich_text),
-            "quote": lambda b: PageBlocksResponse._extract_plain_text(b.quote.rich_text),
-            "callout": lambda b: PageBlocksResponse._extract_plain_text(b.callout.rich_text),
-            "code": lambda b: PageBlocksResponse._extract_plain_text(b.code.rich_text),
-            "child_page": lambda b: b.child_page.title,
-            "child_database": lambda b: b.child_database.title,
-            "equation": lambda b: b.equation.expression,
-            "bookmark": lambda b: b.bookmark.url,
-            "embed": lambda b: b.embed.url,
-            "link_preview": lambda b: b.link_preview.url,
-        }
-        
-        extractor = content_map.get(block_type)
+        extractor = _BLOCK_TEXT_EXTRACTORS.get(block.type)
         return extractor(block) if extractor else ""
 
     # =========================================================================
@@ -547,10 +518,8 @@ class PageBlocksResponse(BaseModel):
     # =========================================================================
 
     @staticmethod
-    def _rich_text_to_markdown(rich_text_list: list[RichText]) -> str:
-        """Convert a list of rich text objects to markdown string with formatting."""
-        result = []
-        
+    def _write_rich_text(rich_text_list: list[RichText], out: list[str]) -> None:
+        """Append a list of rich text objects to out as formatted markdown."""
         for rt in rich_text_list:
             text = rt.plain_text
             annotations = rt.annotations
@@ -570,187 +539,21 @@ class PageBlocksResponse(BaseModel):
             if rt.href:
                 text = f"[{text}]({rt.href})"
             
-            result.append(text)
-        
-        return "".join(result)
+            out.append(text)
 
     @staticmethod
-    def _block_to_markdown(block: Block, indent: int = 0, number: int | None = None) -> str:
-        """Convert a single block to markdown string."""
-        indent_str = "    " * indent
-        block_type = block.type
-        
-        match block_type:
-            case "paragraph":
-                text = PageBlocksResponse._rich_text_to_markdown(block.paragraph.rich_text)
-                res = f"{indent_str}{text}\n" if text else "\n"
-                if block.paragraph.children:
-                    for child in block.paragraph.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "heading_1":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_1.rich_text)
-                return f"# {text}\n"
-            
-            case "heading_2":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_2.rich_text)
-                return f"## {text}\n"
-            
-            case "heading_3":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_3.rich_text)
-                return f"### {text}\n"
+    def _rich_text_to_markdown(rich_text_list: list[RichText]) -> str:
+        """Convert a list of rich text objects to markdown string with formatting."""
+        out: list[str] = []
+        PageBlocksResponse._write_rich_text(rich_text_list, out)
+        return "".join(out)
 
-            case "heading_4":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_4.rich_text)
-                return f"#### {text}\n"
-            
-            case "bulleted_list_item":
-                text = PageBlocksResponse._rich_text_to_markdown(block.bulleted_list_item.rich_text)
-                res = f"{indent_str}- {text}\n"
-                if block.bulleted_list_item.children:
-                    for child in block.bulleted_list_item.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "numbered_list_item":
-                text = PageBlocksResponse._rich_text_to_markdown(block.numbered_list_item.rich_text)
-                num = number if number is not None else 1
-                res = f"{indent_str}{num}. {text}\n"
-                if block.numbered_list_item.children:
-                    for child in block.numbered_list_item.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "to_do":
-                text = PageBlocksResponse._rich_text_to_markdown(block.to_do.rich_text)
-                checkbox = "[x]" if block.to_do.checked else "[ ]"
-                res = f"{indent_str}- {checkbox} {text}\n"
-                if block.to_do.children:
-                    for child in block.to_do.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "toggle":
-                text = PageBlocksResponse._rich_text_to_markdown(block.toggle.rich_text)
-                res = f"{indent_str}<details>\n{indent_str}<summary>{text}</summary>\n"
-                if block.toggle.children:
-                    for child in block.toggle.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                res += f"{indent_str}</details>\n"
-                return res
-            
-            case "code":
-                text = PageBlocksResponse._extract_plain_text(block.code.rich_text)
-                lang = block.code.language.value if hasattr(block.code.language, 'value') else block.code.language
-                return f"```{lang}\n{text}\n```\n"
-            
-            case "quote":
-                text = PageBlocksResponse._rich_text_to_markdown(block.quote.rich_text)
-                lines = text.split("\n")
-                res = "\n".join(f"> {line}" for line in lines) + "\n"
-                if block.quote.children:
-                    for child in block.quote.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "callout":
-                text = PageBlocksResponse._rich_text_to_markdown(block.callout.rich_text)
-                icon = ""
-                if block.callout.icon:
-                    if hasattr(block.callout.icon, 'emoji'):
-                        icon = f"{block.callout.icon.emoji} "
-                res = f"> {icon}{text}\n"
-                if block.callout.children:
-                    for child in block.callout.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent + 1)
-                return res
-            
-            case "divider":
-                return "---\n"
-            
-            case "equation":
-                expr = block.equation.expression
-                return f"$$\n{expr}\n$$\n"
-            
-            case "image":
-                url = ""
-                if block.image.external:
-                    url = block.image.external.url
-                caption = PageBlocksResponse._rich_text_to_markdown(block.image.caption) if block.image.caption else "image"
-                return f"![{caption}]({url})\n"
-            
-            case "video":
-                url = ""
-                if block.video.external:
-                    url = block.video.external.url
-                return f"[Video]({url})\n"
-            
-            case "audio":
-                url = ""
-                if block.audio.external:
-                    url = block.audio.external.url
-                return f"[Audio]({url})\n"
-            
-            case "file":
-                url = ""
-                if block.file.external:
-                    url = block.file.external.url
-                name = block.file.name or "file"
-                return f"[{name}]({url})\n"
-            
-            case "pdf":
-                url = ""
-                if block.pdf.external:
-                    url = block.pdf.external.url
-                return f"[PDF]({url})\n"
-            
-            case "bookmark":
-                url = block.bookmark.url
-                caption = PageBlocksResponse._rich_text_to_markdown(block.bookmark.caption) if block.bookmark.caption else url
-                return f"[{caption}]({url})\n"
-            
-            case "embed":
-                return f"[Embed]({block.embed.url})\n"
-            
-            case "link_preview":
-                return f"[Link]({block.link_preview.url})\n"
-            
-            case "child_page":
-                return f"📄 [{block.child_page.title}]()\n"
-            
-            case "child_database":
-                return f"🗄️ [{block.child_database.title}]()\n"
-            
-            case "table_of_contents":
-                return "[TOC]\n"
-            
-            case "breadcrumb":
-                return ""  # Breadcrumbs don't render to markdown
-            
-            case "column_list":
-                res = ""
-                if block.column_list.children:
-                    for child in block.column_list.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent)
-                return res
-
-            case "column":
-                res = ""
-                if block.column.children:
-                    for child in block.column.children:
-                        res += PageBlocksResponse._block_to_markdown(child, indent)
-                return res
-            
-            case "table":
-                return ""  # Table header, rows handled separately
-            
-            case "table_row":
-                cells = [PageBlocksResponse._rich_text_to_markdown(cell) for cell in block.table_row.cells]
-                return "| " + " | ".join(cells) + " |\n"
-            
-            case _:
-                return ""
+    @staticmethod
+    def _block_to_markdown(block: Block, out: list[str], indent: int = 0, number: int | None = None) -> None:
+        """Append a single block to out as markdown."""
+        renderer = _MD_RENDERERS.get(block.type)
+        if renderer:
+            renderer(block, out, indent, number)
 
     def to_markdown(self) -> str:
         """
@@ -759,7 +562,7 @@ class PageBlocksResponse(BaseModel):
         Returns:
             A markdown string representation of all blocks
         """
-        lines: list[str] = []
+        out: list[str] = []
         numbered_list_counter = 0
         prev_type: str | None = None
         
@@ -773,23 +576,13 @@ class PageBlocksResponse(BaseModel):
             # Increment numbered list counter
             if block_type == "numbered_list_item":
                 numbered_list_counter += 1
-                md = self._block_to_markdown(block, number=numbered_list_counter)
+                self._block_to_markdown(block, out, number=numbered_list_counter)
             else:
-                md = self._block_to_markdown(block)
-            
-            if md:
-                lines.append(md)
-            
-            # Add blank line after certain block types for readability
-            if block_type in ("heading_1", "heading_2", "heading_3", "heading_4", "paragraph", "quote", "callout", "code"):
-                if block_type == "paragraph" and not self._get_block_text(block):
-                    pass  # Don't add extra line after empty paragraph
-                elif prev_type not in ("bulleted_list_item", "numbered_list_item", "to_do"):
-                    pass  # Spacing already handled
+                self._block_to_markdown(block, out)
             
             prev_type = block_type
         
-        return "".join(lines)
+        return "".join(out)
 
     def get_plain_text(self) -> str:
         """
@@ -812,225 +605,16 @@ class PageBlocksResponse(BaseModel):
     @staticmethod
     def _wrap_with_color(text: str, color: str) -> str:
         """Wrap text with a color Span component if not default."""
-        if color == "default" or not color:
+        if color is _DEFAULT_COLOR or not color or color == "default":
             return text
         return f'<Span color="{color}">{text}</Span>'
 
     @staticmethod
-    def _block_to_mdx(block: Block, indent: int = 0, number: int | None = None) -> str:
-        """Convert a single block to MDX string with JSX components."""
-        indent_str = "    " * indent
-        block_type = block.type
-        
-        match block_type:
-            case "paragraph":
-                text = PageBlocksResponse._rich_text_to_markdown(block.paragraph.rich_text)
-                color = block.paragraph.color.value if hasattr(block.paragraph.color, 'value') else block.paragraph.color
-                if not text:
-                    res = "\n"
-                else:
-                    text = PageBlocksResponse._wrap_with_color(text, color)
-                    res = f"{indent_str}{text}\n"
-                
-                if block.paragraph.children:
-                    for child in block.paragraph.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                return res
-            
-            case "heading_1":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_1.rich_text)
-                color = block.heading_1.color.value if hasattr(block.heading_1.color, 'value') else block.heading_1.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                return f"# {text}\n"
-            
-            case "heading_2":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_2.rich_text)
-                color = block.heading_2.color.value if hasattr(block.heading_2.color, 'value') else block.heading_2.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                return f"## {text}\n"
-            
-            case "heading_3":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_3.rich_text)
-                color = block.heading_3.color.value if hasattr(block.heading_3.color, 'value') else block.heading_3.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                return f"### {text}\n"
-
-            case "heading_4":
-                text = PageBlocksResponse._rich_text_to_markdown(block.heading_4.rich_text)
-                color = block.heading_4.color.value if hasattr(block.heading_4.color, 'value') else block.heading_4.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                return f"#### {text}\n"
-            
-            case "bulleted_list_item":
-                text = PageBlocksResponse._rich_text_to_markdown(block.bulleted_list_item.rich_text)
-                color = block.bulleted_list_item.color.value if hasattr(block.bulleted_list_item.color, 'value') else block.bulleted_list_item.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                res = f"{indent_str}- {text}\n\n"
-                if block.bulleted_list_item.children:
-                    for child in block.bulleted_list_item.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                return res
-            
-            case "numbered_list_item":
-                text = PageBlocksResponse._rich_text_to_markdown(block.numbered_list_item.rich_text)
-                color = block.numbered_list_item.color.value if hasattr(block.numbered_list_item.color, 'value') else block.numbered_list_item.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                num = number if number is not None else 1
-                res = f"{indent_str}{num}. {text}\n\n"
-                if block.numbered_list_item.children:
-                    for child in block.numbered_list_item.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                return res
-            
-            case "to_do":
-                text = PageBlocksResponse._rich_text_to_markdown(block.to_do.rich_text)
-                color = block.to_do.color.value if hasattr(block.to_do.color, 'value') else block.to_do.color
-                text = PageBlocksResponse._wrap_with_color(text, color)
-                checkbox = "[x]" if block.to_do.checked else "[ ]"
-                res = f"{indent_str}- {checkbox} {text}\n"
-                if block.to_do.children:
-                    for child in block.to_do.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                return res
-            
-            case "toggle":
-                text = PageBlocksResponse._rich_text_to_markdown(block.toggle.rich_text)
-                color = block.toggle.color.value if hasattr(block.toggle.color, 'value') else block.toggle.color
-                res = f'<Accordion title="{text}" color="{color}">\n'
-                if block.toggle.children:
-                    for child in block.toggle.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                res += "</Accordion>\n"
-                return res
-            
-            case "code":
-                text = PageBlocksResponse._extract_plain_text(block.code.rich_text)
-                lang = block.code.language
-                return f"```{lang}\n{text}\n```\n"
-            
-            case "quote":
-                text = PageBlocksResponse._rich_text_to_markdown(block.quote.rich_text)
-                color = block.quote.color.value if hasattr(block.quote.color, 'value') else block.quote.color
-                if color != "default":
-                    res = f'<Quote color="{color}">{text}\n'
-                else:
-                    lines = text.split("\n")
-                    res = "\n".join(f"> {line}" for line in lines) + "\n"
-                
-                if block.quote.children:
-                    for child in block.quote.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                
-                if color != "default":
-                    res += "</Quote>\n"
-                return res
-            
-            case "callout":
-                text = PageBlocksResponse._rich_text_to_markdown(block.callout.rich_text)
-                color = block.callout.color.value if hasattr(block.callout.color, 'value') else block.callout.color
-                icon = ""
-                if block.callout.icon:
-                    if hasattr(block.callout.icon, 'emoji'):
-                        icon = block.callout.icon.emoji
-                res = f'<Callout icon="{icon}" color="{color}">\n  {text}\n'
-                if block.callout.children:
-                    for child in block.callout.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                res += "</Callout>\n"
-                return res
-            
-            case "divider":
-                return "---\n"
-            
-            case "equation":
-                expr = block.equation.expression
-                return f"<Math>{expr}</Math>\n"
-            
-            case "image":
-                url = ""
-                if block.image.external:
-                    url = block.image.external.url
-                caption = PageBlocksResponse._rich_text_to_markdown(block.image.caption) if block.image.caption else ""
-                if caption:
-                    return f'<Image src="{url}" alt="{caption}" />\n'
-                return f'<Image src="{url}" />\n'
-            
-            case "video":
-                url = ""
-                if block.video.external:
-                    url = block.video.external.url
-                return f'<Video src="{url}" />\n'
-            
-            case "audio":
-                url = ""
-                if block.audio.external:
-                    url = block.audio.external.url
-                return f'<Audio src="{url}" />\n'
-            
-            case "file":
-                url = ""
-                if block.file.external:
-                    url = block.file.external.url
-                name = block.file.name or "file"
-                return f'<FileDownload href="{url}" name="{name}" />\n'
-            
-            case "pdf":
-                url = ""
-                if block.pdf.external:
-                    url = block.pdf.external.url
-                return f'<PDF src="{url}" />\n'
-            
-            case "bookmark":
-                url = block.bookmark.url
-                caption = PageBlocksResponse._rich_text_to_markdown(block.bookmark.caption) if block.bookmark.caption else url
-                return f'<Bookmark url="{url}" title="{caption}" />\n'
-            
-            case "embed":
-                return f'<Embed url="{block.embed.url}" />\n'
-            
-            case "link_preview":
-                return f'<LinkPreview url="{block.link_preview.url}" />\n'
-            
-            case "child_page":
-                return f'<ChildPage title="{block.child_page.title}" />\n'
-            
-            case "child_database":
-                return f'<ChildDatabase title="{block.child_database.title}" />\n'
-            
-            case "table_of_contents":
-                color = block.table_of_contents.color.value if hasattr(block.table_of_contents.color, 'value') else block.table_of_contents.color
-                if color != "default":
-                    return f'<TableOfContents color="{color}" />\n'
-                return "<TableOfContents />\n"
-            
-            case "breadcrumb":
-                return ""
-            
-            case "column_list":
-                res = "<ColumnList>\n"
-                if block.column_list.children:
-                    for child in block.column_list.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent)
-                res += "</ColumnList>\n"
-                return res
-
-            case "column":
-                res = "<Column>\n"
-                if block.column.children:
-                    for child in block.column.children:
-                        res += PageBlocksResponse._block_to_mdx(child, indent + 1)
-                res += "</Column>\n"
-                return res
-            
-            case "table":
-                return ""
-            
-            case "table_row":
-                cells = [PageBlocksResponse._rich_text_to_markdown(cell) for cell in block.table_row.cells]
-                return "| " + " | ".join(cells) + " |\n"
-            
-            case _:
-                return ""
+    def _block_to_mdx(block: Block, out: list[str], indent: int = 0, number: int | None = None) -> None:
+        """Append a single block to out as MDX with JSX components."""
+        renderer = _MDX_RENDERERS.get(block.type)
+        if renderer:
+            renderer(block, out, indent, number)
 
     def to_mdx(self) -> str:
         """
@@ -1055,7 +639,19 @@ class PageBlocksResponse(BaseModel):
         Returns:
             An MDX string representation of all blocks
         """
-        lines: list[str] = []
+        return "".join(self.to_mdx_chunks())
+
+    def to_mdx_chunks(self) -> list[str]:
+        """
+        Convert the page blocks to MDX as a list of string fragments.
+        
+        Same output as to_mdx, left unjoined so it can be streamed to a
+        file without building the whole document as one string.
+        
+        Returns:
+            The MDX fragments, in document order
+        """
+        out: list[str] = []
         numbered_list_counter = 0
         prev_type: str | None = None
         
@@ -1066,17 +662,496 @@ class PageBlocksResponse(BaseModel):
             if block_type != "numbered_list_item" and prev_type == "numbered_list_item":
                 numbered_list_counter = 0
             
+            written = len(out)
+            
             # Increment numbered list counter
             if block_type == "numbered_list_item":
                 numbered_list_counter += 1
-                mdx = self._block_to_mdx(block, number=numbered_list_counter)
+                self._block_to_mdx(block, out, number=numbered_list_counter)
             else:
-                mdx = self._block_to_mdx(block)
+                self._block_to_mdx(block, out)
             
-            if mdx:
-                lines.append(mdx)
-                lines.append("\n")  # Extra line between blocks
+            if len(out) > written:
+                out.append("\n")  # Extra line between blocks
             
             prev_type = block_type
         
-        return "".join(lines)
+        return out
+
+
+# =============================================================================
+# Plain Text Extractors
+# =============================================================================
+
+# map() with an attrgetter walks the runs in C instead of a generator frame
+_PLAIN_TEXT = attrgetter("plain_text")
+
+
+def _rich_text_extractor(path: str) -> Callable[[Block], str]:
+    """Build an extractor returning the plain text of the rich text at path."""
+    get_rich_text = attrgetter(path)
+    return lambda b: "".join(map(_PLAIN_TEXT, get_rich_text(b)))
+
+
+# Plain string fields use bare attrgetters, which resolve the path in C
+_BLOCK_TEXT_EXTRACTORS: dict[str, Callable[[Block], str]] = {
+    "paragraph": _rich_text_extractor("paragraph.rich_text"),
+    "heading_1": _rich_text_extractor("heading_1.rich_text"),
+    "heading_2": _rich_text_extractor("heading_2.rich_text"),
+    "heading_3": _rich_text_extractor("heading_3.rich_text"),
+    "heading_4": _rich_text_extractor("heading_4.rich_text"),
+    "bulleted_list_item": _rich_text_extractor("bulleted_list_item.rich_text"),
+    "numbered_list_item": _rich_text_extractor("numbered_list_item.rich_text"),
+    "to_do": _rich_text_extractor("to_do.rich_text"),
+    "toggle": _rich_text_extractor("toggle.rich_text"),
+    "quote": _rich_text_extractor("quote.rich_text"),
+    "callout": _rich_text_extractor("callout.rich_text"),
+    "code": _rich_text_extractor("code.rich_text"),
+    "child_page": attrgetter("child_page.title"),
+    "child_database": attrgetter("child_database.title"),
+    "equation": attrgetter("equation.expression"),
+    "bookmark": attrgetter("bookmark.url"),
+    "embed": attrgetter("embed.url"),
+    "link_preview": attrgetter("link_preview.url"),
+}
+
+
+# =============================================================================
+# Shared Renderer Helpers
+# =============================================================================
+
+# Markdown prefix and content getter for each heading level
+_HEADINGS: dict[str, tuple[str, Callable[[Block], HeadingContent]]] = {
+    "heading_1": ("# ", attrgetter("heading_1")),
+    "heading_2": ("## ", attrgetter("heading_2")),
+    "heading_3": ("### ", attrgetter("heading_3")),
+    "heading_4": ("#### ", attrgetter("heading_4")),
+}
+
+
+# NotionColor.DEFAULT.value is the one "default" object every parsed
+# color resolves to, so renderers can test for it by identity
+_DEFAULT_COLOR = NotionColor.DEFAULT.value
+
+
+def _color_str(value: NotionColor | str) -> str:
+    """Get the plain string of an enum value (color, language) or a str."""
+    return getattr(value, "value", value)
+
+
+def _external_url(file: FileObject) -> str:
+    """Get the URL of an external file, or an empty string."""
+    return file.external.url if file.external else ""
+
+
+def _write_table_row(block: Block, out: list[str]) -> None:
+    """Append a table row as a markdown table line."""
+    out.append("| ")
+    for i, cell in enumerate(block.table_row.cells):
+        if i:
+            out.append(" | ")
+        PageBlocksResponse._write_rich_text(cell, out)
+    out.append(" |\n")
+
+
+# =============================================================================
+# Markdown Block Renderers
+# =============================================================================
+#
+# Each renderer takes (block, out, indent, number) and appends the block's
+# markdown to out. Block types without an entry in _MD_RENDERERS render to
+# nothing.
+
+def _md_children(children: list[Block] | None, out: list[str], indent: int) -> None:
+    """Append nested child blocks to out as markdown."""
+    if children:
+        for child in children:
+            PageBlocksResponse._block_to_markdown(child, out, indent)
+
+
+def _md_paragraph(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.paragraph.rich_text)
+    out.append(f"{'    ' * indent}{text}\n" if text else "\n")
+    _md_children(block.paragraph.children, out, indent + 1)
+
+
+def _md_heading(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    prefix, get_heading = _HEADINGS[block.type]
+    out.append(prefix)
+    PageBlocksResponse._write_rich_text(get_heading(block).rich_text, out)
+    out.append("\n")
+
+
+def _md_bulleted_list_item(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"{'    ' * indent}- ")
+    PageBlocksResponse._write_rich_text(block.bulleted_list_item.rich_text, out)
+    out.append("\n")
+    _md_children(block.bulleted_list_item.children, out, indent + 1)
+
+
+def _md_numbered_list_item(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    num = number if number is not None else 1
+    out.append(f"{'    ' * indent}{num}. ")
+    PageBlocksResponse._write_rich_text(block.numbered_list_item.rich_text, out)
+    out.append("\n")
+    _md_children(block.numbered_list_item.children, out, indent + 1)
+
+
+def _md_to_do(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    checkbox = "[x]" if block.to_do.checked else "[ ]"
+    out.append(f"{'    ' * indent}- {checkbox} ")
+    PageBlocksResponse._write_rich_text(block.to_do.rich_text, out)
+    out.append("\n")
+    _md_children(block.to_do.children, out, indent + 1)
+
+
+def _md_toggle(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    indent_str = "    " * indent
+    out.append(f"{indent_str}<details>\n{indent_str}<summary>")
+    PageBlocksResponse._write_rich_text(block.toggle.rich_text, out)
+    out.append("</summary>\n")
+    _md_children(block.toggle.children, out, indent + 1)
+    out.append(f"{indent_str}</details>\n")
+
+
+def _md_code(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._extract_plain_text(block.code.rich_text)
+    lang = _color_str(block.code.language)
+    out.append(f"```{lang}\n{text}\n```\n")
+
+
+def _md_quote(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.quote.rich_text)
+    lines = text.split("\n")
+    out.append("\n".join(f"> {line}" for line in lines) + "\n")
+    _md_children(block.quote.children, out, indent + 1)
+
+
+def _md_callout(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    icon = ""
+    if block.callout.icon:
+        if hasattr(block.callout.icon, 'emoji'):
+            icon = f"{block.callout.icon.emoji} "
+    out.append(f"> {icon}")
+    PageBlocksResponse._write_rich_text(block.callout.rich_text, out)
+    out.append("\n")
+    _md_children(block.callout.children, out, indent + 1)
+
+
+def _md_divider(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append("---\n")
+
+
+def _md_equation(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"$$\n{block.equation.expression}\n$$\n")
+
+
+def _md_image(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    caption = PageBlocksResponse._rich_text_to_markdown(block.image.caption) if block.image.caption else "image"
+    out.append(f"![{caption}]({_external_url(block.image)})\n")
+
+
+def _md_video(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"[Video]({_external_url(block.video)})\n")
+
+
+def _md_audio(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"[Audio]({_external_url(block.audio)})\n")
+
+
+def _md_file(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    name = block.file.name or "file"
+    out.append(f"[{name}]({_external_url(block.file)})\n")
+
+
+def _md_pdf(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"[PDF]({_external_url(block.pdf)})\n")
+
+
+def _md_bookmark(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    url = block.bookmark.url
+    caption = PageBlocksResponse._rich_text_to_markdown(block.bookmark.caption) if block.bookmark.caption else url
+    out.append(f"[{caption}]({url})\n")
+
+
+def _md_embed(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"[Embed]({block.embed.url})\n")
+
+
+def _md_link_preview(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"[Link]({block.link_preview.url})\n")
+
+
+def _md_child_page(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"📄 [{block.child_page.title}]()\n")
+
+
+def _md_child_database(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"🗄️ [{block.child_database.title}]()\n")
+
+
+def _md_table_of_contents(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append("[TOC]\n")
+
+
+def _md_column_list(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    _md_children(block.column_list.children, out, indent)
+
+
+def _md_column(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    _md_children(block.column.children, out, indent)
+
+
+def _md_table_row(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    _write_table_row(block, out)
+
+
+_MD_RENDERERS: dict[str, Callable[[Block, list[str], int, int | None], None]] = {
+    "paragraph": _md_paragraph,
+    "heading_1": _md_heading,
+    "heading_2": _md_heading,
+    "heading_3": _md_heading,
+    "heading_4": _md_heading,
+    "bulleted_list_item": _md_bulleted_list_item,
+    "numbered_list_item": _md_numbered_list_item,
+    "to_do": _md_to_do,
+    "toggle": _md_toggle,
+    "code": _md_code,
+    "quote": _md_quote,
+    "callout": _md_callout,
+    "divider": _md_divider,
+    "equation": _md_equation,
+    "image": _md_image,
+    "video": _md_video,
+    "audio": _md_audio,
+    "file": _md_file,
+    "pdf": _md_pdf,
+    "bookmark": _md_bookmark,
+    "embed": _md_embed,
+    "link_preview": _md_link_preview,
+    "child_page": _md_child_page,
+    "child_database": _md_child_database,
+    "table_of_contents": _md_table_of_contents,
+    "column_list": _md_column_list,
+    "column": _md_column,
+    "table_row": _md_table_row,
+    # breadcrumb, table (rows render themselves) and unsupported: no output
+}
+
+
+# =============================================================================
+# MDX Block Renderers
+# =============================================================================
+#
+# Each renderer takes (block, out, indent, number) and appends the block's
+# MDX to out. Block types without an entry in _MDX_RENDERERS render to
+# nothing.
+
+def _mdx_children(children: list[Block] | None, out: list[str], indent: int) -> None:
+    """Append nested child blocks to out as MDX."""
+    if children:
+        for child in children:
+            PageBlocksResponse._block_to_mdx(child, out, indent)
+
+
+def _mdx_paragraph(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.paragraph.rich_text)
+    color = _color_str(block.paragraph.color)
+    if not text:
+        out.append("\n")
+    else:
+        if color is not _DEFAULT_COLOR:
+            text = PageBlocksResponse._wrap_with_color(text, color)
+        out.append(f"{'    ' * indent}{text}\n")
+    _mdx_children(block.paragraph.children, out, indent + 1)
+
+
+def _mdx_heading(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    prefix, get_heading = _HEADINGS[block.type]
+    heading = get_heading(block)
+    text = PageBlocksResponse._rich_text_to_markdown(heading.rich_text)
+    color = _color_str(heading.color)
+    if color is not _DEFAULT_COLOR:
+        text = PageBlocksResponse._wrap_with_color(text, color)
+    out.append(f"{prefix}{text}\n")
+
+
+def _mdx_bulleted_list_item(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.bulleted_list_item.rich_text)
+    color = _color_str(block.bulleted_list_item.color)
+    if color is not _DEFAULT_COLOR:
+        text = PageBlocksResponse._wrap_with_color(text, color)
+    out.append(f"{'    ' * indent}- {text}\n\n")
+    _mdx_children(block.bulleted_list_item.children, out, indent + 1)
+
+
+def _mdx_numbered_list_item(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.numbered_list_item.rich_text)
+    color = _color_str(block.numbered_list_item.color)
+    if color is not _DEFAULT_COLOR:
+        text = PageBlocksResponse._wrap_with_color(text, color)
+    num = number if number is not None else 1
+    out.append(f"{'    ' * indent}{num}. {text}\n\n")
+    _mdx_children(block.numbered_list_item.children, out, indent + 1)
+
+
+def _mdx_to_do(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.to_do.rich_text)
+    color = _color_str(block.to_do.color)
+    if color is not _DEFAULT_COLOR:
+        text = PageBlocksResponse._wrap_with_color(text, color)
+    checkbox = "[x]" if block.to_do.checked else "[ ]"
+    out.append(f"{'    ' * indent}- {checkbox} {text}\n")
+    _mdx_children(block.to_do.children, out, indent + 1)
+
+
+def _mdx_toggle(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.toggle.rich_text)
+    color = _color_str(block.toggle.color)
+    out.append(f'<Accordion title="{text}" color="{color}">\n')
+    _mdx_children(block.toggle.children, out, indent + 1)
+    out.append("</Accordion>\n")
+
+
+def _mdx_code(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._extract_plain_text(block.code.rich_text)
+    out.append(f"```{block.code.language}\n{text}\n```\n")
+
+
+def _mdx_quote(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    text = PageBlocksResponse._rich_text_to_markdown(block.quote.rich_text)
+    color = _color_str(block.quote.color)
+    if color != "default":
+        out.append(f'<Quote color="{color}">{text}\n')
+    else:
+        lines = text.split("\n")
+        out.append("\n".join(f"> {line}" for line in lines) + "\n")
+    _mdx_children(block.quote.children, out, indent + 1)
+    if color != "default":
+        out.append("</Quote>\n")
+
+
+def _mdx_callout(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    color = _color_str(block.callout.color)
+    icon = ""
+    if block.callout.icon:
+        if hasattr(block.callout.icon, 'emoji'):
+            icon = block.callout.icon.emoji
+    out.append(f'<Callout icon="{icon}" color="{color}">\n  ')
+    PageBlocksResponse._write_rich_text(block.callout.rich_text, out)
+    out.append("\n")
+    _mdx_children(block.callout.children, out, indent + 1)
+    out.append("</Callout>\n")
+
+
+def _mdx_divider(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append("---\n")
+
+
+def _mdx_equation(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f"<Math>{block.equation.expression}</Math>\n")
+
+
+def _mdx_image(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    url = _external_url(block.image)
+    caption = PageBlocksResponse._rich_text_to_markdown(block.image.caption) if block.image.caption else ""
+    if caption:
+        out.append(f'<Image src="{url}" alt="{caption}" />\n')
+    else:
+        out.append(f'<Image src="{url}" />\n')
+
+
+def _mdx_video(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<Video src="{_external_url(block.video)}" />\n')
+
+
+def _mdx_audio(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<Audio src="{_external_url(block.audio)}" />\n')
+
+
+def _mdx_file(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    name = block.file.name or "file"
+    out.append(f'<FileDownload href="{_external_url(block.file)}" name="{name}" />\n')
+
+
+def _mdx_pdf(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<PDF src="{_external_url(block.pdf)}" />\n')
+
+
+def _mdx_bookmark(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    url = block.bookmark.url
+    caption = PageBlocksResponse._rich_text_to_markdown(block.bookmark.caption) if block.bookmark.caption else url
+    out.append(f'<Bookmark url="{url}" title="{caption}" />\n')
+
+
+def _mdx_embed(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<Embed url="{block.embed.url}" />\n')
+
+
+def _mdx_link_preview(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<LinkPreview url="{block.link_preview.url}" />\n')
+
+
+def _mdx_child_page(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<ChildPage title="{block.child_page.title}" />\n')
+
+
+def _mdx_child_database(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append(f'<ChildDatabase title="{block.child_database.title}" />\n')
+
+
+def _mdx_table_of_contents(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    color = _color_str(block.table_of_contents.color)
+    if color != "default":
+        out.append(f'<TableOfContents color="{color}" />\n')
+    else:
+        out.append("<TableOfContents />\n")
+
+
+def _mdx_column_list(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append("<ColumnList>\n")
+    _mdx_children(block.column_list.children, out, indent)
+    out.append("</ColumnList>\n")
+
+
+def _mdx_column(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    out.append("<Column>\n")
+    _mdx_children(block.column.children, out, indent + 1)
+    out.append("</Column>\n")
+
+
+def _mdx_table_row(block: Block, out: list[str], indent: int, number: int | None) -> None:
+    _write_table_row(block, out)
+
+
+_MDX_RENDERERS: dict[str, Callable[[Block, list[str], int, int | None], None]] = {
+    "paragraph": _mdx_paragraph,
+    "heading_1": _mdx_heading,
+    "heading_2": _mdx_heading,
+    "heading_3": _mdx_heading,
+    "heading_4": _mdx_heading,
+    "bulleted_list_item": _mdx_bulleted_list_item,
+    "numbered_list_item": _mdx_numbered_list_item,
+    "to_do": _mdx_to_do,
+    "toggle": _mdx_toggle,
+    "code": _mdx_code,
+    "quote": _mdx_quote,
+    "callout": _mdx_callout,
+    "divider": _mdx_divider,
+    "equation": _mdx_equation,
+    "image": _mdx_image,
+    "video": _mdx_video,
+    "audio": _mdx_audio,
+    "file": _mdx_file,
+    "pdf": _mdx_pdf,
+    "bookmark": _mdx_bookmark,
+    "embed": _mdx_embed,
+    "link_preview": _mdx_link_preview,
+    "child_page": _mdx_child_page,
+    "child_database": _mdx_child_database,
+    "table_of_contents": _mdx_table_of_contents,
+    "column_list": _mdx_column_list,
+    "column": _mdx_column,
+    "table_row": _mdx_table_row,
+    # breadcrumb, table (rows render themselves) and unsupported: no output
+}
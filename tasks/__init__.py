@@ -5,9 +5,10 @@ Reusable task functions for NotionFlare.
 """
 
 from .datasource import fetch_datasource_pages
-from .mdx_converter import convert_pages_to_mdx
+from .mdx_converter import convert_pages_to_mdx, render_page_mdx
 
 __all__ = [
     "fetch_datasource_pages",
     "convert_pages_to_mdx",
+    "render_page_mdx",
 ]
@@ -5,61 +5,123 @@ Convert Notion pages to MDX files.
 """
 
 import json
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from models.blogdatasource import BlogPage
-from utils.notion import fetch_all_blocks, sanitize_filename
+from models.pageblocks import PageBlocksResponse
+from utils.notion import fetch_all_blocks, get_max_concurrent_requests, sanitize_filename
 
 
-def convert_page_to_mdx(page: BlogPage, output_dir: Path) -> str | None:
+# Frontmatter layout, filled per page with str.format_map; values arrive
+# already quoted by _yaml_quote
+_FRONTMATTER_TMPL = """---
+title: {title}
+slug: {slug}
+description: {description}
+type: {type}
+status: {status}
+tags: {tags}
+last_edited: {last_edited}
+---
+
+"""
+
+
+# Characters json.dumps leaves raw that YAML rejects (DEL, C1 controls,
+# U+FFFE/U+FFFF) or reads as line breaks (NEL, U+2028, U+2029)
+_YAML_UNSAFE_CHARS = re.compile(r"[\x7f-\x9f\u2028\u2029\ufffe\uffff]")
+
+
+def _yaml_escape_char(match: re.Match[str]) -> str:
+    """Escape one character with a YAML \\x or \\u escape."""
+    code = ord(match.group())
+    return f"\\x{code:02x}" if code <= 0xFF else f"\\u{code:04x}"
+
+
+def _yaml_quote(value: str) -> str:
+    """Quote a string as a YAML double-quoted scalar."""
+    # A JSON string is a valid YAML double-quoted scalar, with quotes,
+    # backslashes and C0 controls escaped; the rest are escaped here
+    return _YAML_UNSAFE_CHARS.sub(_yaml_escape_char, json.dumps(value, ensure_ascii=False))
+
+
+def _fetch_page_blocks(page: BlogPage) -> PageBlocksResponse:
+    """Fetch the full block tree of a page."""
+    return fetch_all_blocks(page.get_notion_page_id())
+
+
+def _write_file(file_path: Path, chunks: list[str]) -> str:
+    """Write document chunks to a file as UTF-8, in order, and return its path."""
+    # The text layer encodes through its own buffer, so neither the full
+    # document string nor its encoded bytes are ever held in memory
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(chunks)
+    return str(file_path)
+
+
+def render_page_mdx(page: BlogPage, blocks_response: PageBlocksResponse) -> list[str]:
+    """
+    Render a page and its blocks to an MDX document.
+    
+    Pure function with no I/O, so it can be mapped over a process pool.
+    The document is returned as the frontmatter followed by the block
+    fragments, so it can be written without ever concatenating the whole
+    document; join them for the full text.
+    
+    Args:
+        page: The BlogPage providing the frontmatter
+        blocks_response: The page's fetched block tree
+        
+    Returns:
+        The MDX document chunks (frontmatter followed by content)
+    """
+    # Convert to MDX fragments
+    content = blocks_response.to_mdx_chunks()
+    
+    # Build frontmatter
+    values = {
+        "title": _yaml_quote(page.get_title()),
+        "slug": _yaml_quote(page.get_slug()),
+        "description": _yaml_quote(page.get_description()),
+        "type": _yaml_quote(page.get_type() or ""),
+        "status": _yaml_quote(str(page.get_status())),
+        "tags": json.dumps(page.get_tags()),  # Format as JSON array for YAML
+        "last_edited": _yaml_quote(page.last_edited_time.isoformat()),
+    }
+    frontmatter = _FRONTMATTER_TMPL.format_map(values)
+    return [frontmatter, *content]
+
+
+def _render_page_to_mdx(
+    page: BlogPage,
+    output_dir: Path,
+    blocks_future: Future[PageBlocksResponse],
+) -> tuple[Path, list[str]] | None:
     """
-    Convert a single Notion page to MDX.
+    Render a single Notion page to MDX document chunks.
     
     Args:
-        page: The BlogPage to convert
-        output_dir: Directory to write the MDX file
+        page: The BlogPage to render
+        output_dir: Directory the MDX file will be written to
+        blocks_future: Pending prefetch of the page's blocks
         
     Returns:
-        Path to the generated file, or None on error
+        Target file path and document chunks, or None on error
     """
     title = page.get_title()
-    slug = page.get_slug()
-    status = page.get_status()
-    page_id = page.get_notion_page_id()
     
     try:
-        # Fetch blocks
-        blocks_response = fetch_all_blocks(page_id)
-        
-        # Convert to MDX
-        content = blocks_response.to_mdx()
+        # Wait for the prefetch to finish
+        blocks_response = blocks_future.result()
         
         # Generate filename from slug or title
-        filename = (slug or sanitize_filename(title)) + ".mdx"
+        filename = (page.get_slug() or sanitize_filename(title)) + ".mdx"
         file_path = output_dir / filename
         
-        # Get tags, description, type
-        tags = page.get_tags()
-        tags_yaml = json.dumps(tags)  # Format as JSON array for YAML
-        description = page.get_description()
-        page_type = page.get_type() or ""
-        
-        # Build frontmatter
-        frontmatter = f'''---
-title: "{title}"
-slug: "{slug}"
-description: "{description}"
-type: "{page_type}"
-status: "{status}"
-tags: {tags_yaml}
-last_edited: "{page.last_edited_time.isoformat()}"
----
-
-'''
-        # Write file
-        file_path.write_text(frontmatter + content, encoding="utf-8")
-        
-        return str(file_path)
+        return file_path, render_page_mdx(page, blocks_response)
         
     except Exception as e:
         print(f"  Error converting page {title}: {e}")
@@ -82,16 +144,47 @@ def convert_pages_to_mdx(pages: list[BlogPage], output_dir: str = "./content") -
     
     generated_files = []
     
-    for page in pages:
-        print(f"Processing: {page.get_title()}")
-        print(f"  Status: {page.get_status()}, Slug: {page.get_slug()}")
+    with (
+        ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as fetch_executor,
+        # One writer keeps writes in page order, so two pages resolving to
+        # the same file never write it at once and the later page wins
+        ThreadPoolExecutor(max_workers=1) as write_executor,
+    ):
+        # Fetch all block trees concurrently; pages are rendered in order
+        # as their blocks arrive, overlapping Notion latency across pages.
+        # Each future is popped as its page is rendered, so a block tree is
+        # freed once its page is done rather than held until the end.
+        futures = deque(fetch_executor.submit(_fetch_page_blocks, page) for page in pages)
         
-        file_path = convert_page_to_mdx(page, output_path)
+        # Rendering stays on this thread; writes are handed off so the
+        # next page renders while the previous one is written.
+        pending_writes: list[tuple[Path, Future[str]]] = []
+        seen_paths: set[Path] = set()
         
-        if file_path:
-            print(f"  Written: {file_path}")
-            generated_files.append(file_path)
+        for page in pages:
+            print(f"Processing: {page.get_title()}")
+            print(f"  Status: {page.get_status()}, Slug: {page.get_slug()}")
+            
+            rendered = _render_page_to_mdx(page, output_path, futures.popleft())
+            
+            if rendered:
+                file_path = rendered[0]
+                if file_path in seen_paths:
+                    print(f"  Warning: {file_path.name} was already produced by an earlier page; this page overwrites it")
+                seen_paths.add(file_path)
+                pending_writes.append((file_path, write_executor.submit(_write_file, *rendered)))
+            
+            print()
         
-        print()
+        # Writes finish in the background, so they are reported together
+        if pending_writes:
+            print("Writing MDX files...")
+        for file_path, write_future in pending_writes:
+            try:
+                generated_files.append(write_future.result())
+            except Exception as e:
+                print(f"  Error writing {file_path}: {e}")
+                continue
+            print(f"  Written: {file_path}")
     
     return generated_files
@@ -3,12 +3,16 @@ from .notion import (
     fetch_all_pages,
     fetch_all_blocks,
     sanitize_filename,
+    dumps_json,
     set_github_output,
+    set_github_outputs,
 )
 
 __all__ = [
     "fetch_all_pages",
     "fetch_all_blocks", 
     "sanitize_filename",
+    "dumps_json",
     "set_github_output",
+    "set_github_outputs",
 ]
@@ -4,13 +4,69 @@ Notion API Utilities
 Shared functions for interacting with the Notion API.
 """
 
+import atexit
+import json
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from itertools import chain
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
 
 from models.blogdatasource import BlogDataSourceResponse
-from models.pageblocks import PageBlocksResponse
+from models.pageblocks import Block, PageBlocksResponse
+
+# Notion's maximum page size; cursors are opaque, so pagination is inherently
+# serial and the fewest round-trips come from the largest pages.
+PAGE_SIZE = 100
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+# Guards the one-time creation of state shared by all fetch threads
+_shared_lock = threading.Lock()
+_request_slots: threading.BoundedSemaphore | None = None
+_shared_session: requests.Session | None = None
+_block_fetch_pool: ThreadPoolExecutor | None = None
+
+
+@lru_cache()
+def get_max_concurrent_requests() -> int:
+    """
+    Get the upper bound on concurrent Notion requests (cached).
+    
+    Read from NOTION_MAX_CONCURRENCY; lower it if the integration runs
+    into Notion's rate limits.
+    """
+    # Unset workflow variables arrive as empty strings, so treat them as unset
+    value = os.environ.get("NOTION_MAX_CONCURRENCY", "").strip()
+    if not value:
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
+    
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise ValueError(f"NOTION_MAX_CONCURRENCY must be a positive integer, got {value!r}")
+    return limit
+
+
+def _get_request_slots() -> threading.BoundedSemaphore:
+    """Get the semaphore capping in-flight requests across all threads, however deeply fetches nest."""
+    global _request_slots
+    if _request_slots is None:
+        with _shared_lock:
+            if _request_slots is None:
+                _request_slots = threading.BoundedSemaphore(get_max_concurrent_requests())
+    return _request_slots
 
 
 @lru_cache()
@@ -32,6 +88,25 @@ def _headers_dict() -> dict[str, str]:
     return dict(get_notion_headers())
 
 
+def _session() -> requests.Session:
+    """Get the shared HTTP session, reusing keep-alive connections across requests."""
+    # Not lru_cache: threads making their first request at once could each
+    # build a session, so creation happens once under the lock instead
+    global _shared_session
+    if _shared_session is None:
+        with _shared_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                session.headers.update(_headers_dict())
+                # One keep-alive connection per concurrent request, so parallel
+                # fetches never open and discard connections beyond the pool size
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=get_max_concurrent_requests())
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                _shared_session = session
+    return _shared_session
+
+
 # =============================================================================
 # Data Source API
 # =============================================================================
@@ -40,14 +115,16 @@ def query_data_source(data_source_id: str, cursor: str | None = None) -> BlogDat
     """Query a Notion data source."""
     url = f"https://api.notion.com/v1/data_sources/{data_source_id}/query"
     
-    payload = {}
+    payload = {"page_size": PAGE_SIZE}
     if cursor:
         payload["start_cursor"] = cursor
     
-    response = requests.post(url, headers=_headers_dict(), json=payload)
+    with _get_request_slots():
+        response = _session().post(url, json=payload)
     response.raise_for_status()
     
-    return BlogDataSourceResponse.model_validate(response.json())
+    # Validate the raw bytes so JSON parsing and validation happen in one pass
+    return BlogDataSourceResponse.model_validate_json(response.content)
 
 
 def fetch_all_pages(data_source_id: str) -> list:
@@ -74,19 +151,34 @@ def get_block_children(block_id: str, cursor: str | None = None) -> PageBlocksRe
     """Fetch block children from Notion API."""
     url = f"https://api.notion.com/v1/blocks/{block_id}/children"
     
-    params = {}
+    params = {"page_size": PAGE_SIZE}
     if cursor:
         params["start_cursor"] = cursor
     
-    response = requests.get(url, headers=_headers_dict(), params=params)
+    with _get_request_slots():
+        response = _session().get(url, params=params)
     response.raise_for_status()
     
-    return PageBlocksResponse.model_validate(response.json())
+    return PageBlocksResponse.model_validate_json(response.content)
 
 
-def fetch_all_blocks(block_id: str) -> PageBlocksResponse:
-    """Fetch all blocks from a block (page or regular block), handling pagination and recursion."""
-    all_results = []
+def _block_fetch_executor() -> ThreadPoolExecutor:
+    """Get the shared pool that fetches child blocks for every page."""
+    # Page fetch threads reach this concurrently, so the pool is created
+    # once under the lock rather than through lru_cache
+    global _block_fetch_pool
+    if _block_fetch_pool is None:
+        with _shared_lock:
+            if _block_fetch_pool is None:
+                executor = ThreadPoolExecutor(max_workers=get_max_concurrent_requests())
+                atexit.register(executor.shutdown)
+                _block_fetch_pool = executor
+    return _block_fetch_pool
+
+
+def _fetch_block_children(block_id: str) -> PageBlocksResponse:
+    """Fetch all direct children of a block, handling pagination."""
+    chunks: list[list[Block]] = []
     cursor = None
     first_response = None
     
@@ -97,49 +189,89 @@ def fetch_all_blocks(block_id: str) -> PageBlocksResponse:
         if first_response is None:
             first_response = response
         
-        all_results.extend(response.results)
+        chunks.append(response.results)
         
         if not response.has_more:
             break
         cursor = response.next_cursor
     
-    # Recursion for nested blocks
-    for block in all_results:
-        if block.has_children:
-            children_response = fetch_all_blocks(block.id)
+    # Most blocks fit in a single page of results, which needs no copying
+    first_response.results = chunks[0] if len(chunks) == 1 else list(chain.from_iterable(chunks))
+    first_response.has_more = False
+    first_response.next_cursor = None
+    
+    return first_response
+
+
+def fetch_all_blocks(block_id: str) -> PageBlocksResponse:
+    """Fetch all blocks from a block (page or regular block), handling pagination and recursion."""
+    response = _fetch_block_children(block_id)
+    
+    # Walk the tree one level at a time. Each level's subtrees are fetched
+    # concurrently on the shared pool, whose tasks never submit more work,
+    # so thread count stays fixed however deep the tree is.
+    parents = [block for block in response.results if block.has_children]
+    while parents:
+        if len(parents) > 1:
+            executor = _block_fetch_executor()
+            children_responses = list(executor.map(_fetch_block_children, [block.id for block in parents]))
+        else:
+            children_responses = [_fetch_block_children(parents[0].id)]
+        
+        next_parents: list[Block] = []
+        for block, children_response in zip(parents, children_responses):
             # Blocks have content in a field named after their type
             # We need to set the children on that content object
             block_type = block.type
             block_content = getattr(block, block_type)
             if hasattr(block_content, "children"):
                 block_content.children = children_response.results
+            next_parents.extend(child for child in children_response.results if child.has_children)
+        parents = next_parents
     
-    if first_response:
-        first_response.results = all_results
-        first_response.has_more = False
-        first_response.next_cursor = None
-    
-    return first_response
+    return response
 
 
 # =============================================================================
 # Utilities
 # =============================================================================
 
+# \w is exactly str.isalnum() plus "_", so this drops everything but [alnum-_]
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]+")
+_DASH_RUNS = re.compile(r"-{2,}")
+
+
 def sanitize_filename(name: str) -> str:
     """Convert a title to a safe filename."""
-    safe = name.lower().replace(" ", "-")
-    safe = "".join(c for c in safe if c.isalnum() or c in "-_")
-    while "--" in safe:
-        safe = safe.replace("--", "-")
+    safe = _UNSAFE_FILENAME_CHARS.sub("", name.lower().replace(" ", "-"))
+    safe = _DASH_RUNS.sub("-", safe)
     return safe.strip("-") or "untitled"
 
 
+def dumps_json(value) -> str:
+    """
+    Serialize a value to JSON, using orjson when it is installed.
+    
+    Without orjson the output matches json.dumps exactly. orjson always
+    emits compact separators and raw UTF-8, which parses to the same value.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
 def set_github_output(name: str, value: str):
     """Set a GitHub Actions output variable."""
+    set_github_outputs({name: value})
+
+
+def set_github_outputs(outputs: dict[str, str]):
+    """Set several GitHub Actions output variables with a single write."""
     github_output = os.environ.get("GITHUB_OUTPUT")
     if github_output:
-        with open(github_output, "a") as f:
-            f.write(f"{name}={value}\n")
+        # Values may hold non-ASCII filenames; the runner reads this file as UTF-8
+        with open(github_output, "a", encoding="utf-8") as f:
+            f.write("".join(f"{name}={value}\n" for name, value in outputs.items()))
     else:
-        print(f"::set-output name={name}::{value}")
+        for name, value in outputs.items():
+            print(f"::set-output name={name}::{value}")